@@ -1,12 +1,27 @@
-import copy
+import array
+import functools
+import heapq
 import os
 import sys
 import time
-from collections import deque
-from typing import Tuple, List, Dict, Optional, Deque, Union
+from typing import Tuple, List, Dict, Optional, Union, Iterable, Sequence, NamedTuple
 
+import numpy as np
 import pygame
 
+try:
+    # Numba is optional, it compiles the path search kernel to machine code
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*_args, **_kwargs):
+        """
+        Stand-in for :func:`numba.njit` when Numba is not installed, decorated functions run as plain Python.
+        """
+        return lambda func: func
+
 START = "S"
 END = "E"
 FREE = "."
@@ -15,10 +30,19 @@ WALL = "#"
 Point = Tuple[int, int]
 Maze = List[List[str]]
 
+# Names of the moves, indexed by the direction codes stored in the `move_from` array of the path search
+MOVE_NAMES = ("Right", "Down", "Left", "Up")
+
 # https://www.pygame.org/docs/ref/color.html#pygame.Color
 GuiColor = Union[Tuple[int, int, int], Tuple[int, int, int, int]]
 GuiPoint = Tuple[Union[int, float], Union[int, float]]
 
+# Move code of cells which were not reached by any move (the start cell), they are drawn as a square
+NO_MOVE = len(MOVE_NAMES)
+
+# Frame rate of the GUI, all GUI loops wait for the next frame instead of polling as fast as possible
+GUI_FPS = 60
+
 
 def gui_init_window(size: int = 1024) -> pygame.Surface:
     """
@@ -35,9 +59,9 @@ def gui_init_window(size: int = 1024) -> pygame.Surface:
 
     # https://www.pygame.org/docs/ref/display.html
     # Create a window/canvas for the maze to be drawn on
-    canvas: pygame.Surface = pygame.display.set_mode((size, size),
-                                                     flags=(pygame.HWSURFACE + pygame.HWACCEL + pygame.SRCALPHA))
-    # Add SRCALPHA flag to support pixels with RGBA colors (Alpha = transparency).
+    canvas: pygame.Surface = pygame.display.set_mode((size, size), flags=(pygame.HWSURFACE | pygame.DOUBLEBUF))
+    # The window itself is opaque, blending every blit onto a SRCALPHA display would cost twice as much per pixel.
+    # Pixels with RGBA colors (Alpha = transparency) are drawn to a separate overlay surface, see :func:`gui_update`.
 
     pygame.display.set_caption("Python Pathfinding")
 
@@ -51,9 +75,15 @@ def gui_handle_events(wait_left_click: bool = False) -> bool:
     :return: True if all events were processed and the program shall continue parsing GUI events,
              False if window was closed and program should exit.
     """
+    if not pygame.display.get_init():
+        # The window was already closed by a previous call
+        return False
+
     run = True
     # Events are usually processed only once per call of this function, except if some specific events are awaited
     loop = 0 + wait_left_click  # bool True is 1
+    # Paces the loop while waiting for the events, so it doesn't keep a CPU core busy
+    clock = pygame.time.Clock()
 
     while True:
         # https://www.pygame.org/docs/ref/event.html#pygame.event.get
@@ -66,8 +96,8 @@ def gui_handle_events(wait_left_click: bool = False) -> bool:
                 break
 
             if event.type == pygame.constants.MOUSEBUTTONDOWN:
-                # If the Left mouse button was pressed
-                if wait_left_click and pygame.mouse.get_pressed()[0]:
+                # If the Left mouse button was pressed, the event itself tells which button it was
+                if wait_left_click and event.button == 1:
                     loop -= 1  # One of the awaited event was just handled
                     wait_left_click = False  # Not waiting for this event anymore
 
@@ -75,46 +105,142 @@ def gui_handle_events(wait_left_click: bool = False) -> bool:
             # No specific event is being awaited (anymore)
             break
 
+        clock.tick(GUI_FPS)
+
     return run
 
 
-maze_already_drawn = False
+def gui_poll_quit_fast() -> bool:
+    """
+    Keep the window responsive while drawing frequently (e.g. while path searching), without handling the events
+
+    Unlike :func:`gui_handle_events`, which is used for the waiting and idle loops, this doesn't create a Python
+    list and event objects for all pending events, it only lets SDL process its event queue and asks it whether
+    the window was closed. The events stay queued until :func:`gui_handle_events` handles them.
+
+    :return: True if the program shall continue, False if the window was closed.
+    """
+    pygame.event.pump()
+    return not pygame.event.peek(pygame.QUIT)
+
+
+@functools.lru_cache()
+def gui_arrow_shapes(size: float, cell_w: int = 1, cell_h: int = 1) -> np.ndarray:
+    """
+    Shapes drawn inside a maze cell to show the move which reached it, for a cell at (0, 0)
+
+    The shapes are cached for each size, so drawing many cells only has to move them to the cell positions.
+
+    :param size:   Size of the shape relative to the cell.
+    :param cell_w: Width of the cell.
+    :param cell_h: Height of the cell.
+
+    :return: Array of shape (5, 4, 2) with the polygon points (x, y) of the triangle pointing in the direction
+             of each move, indexed by the move codes (see `MOVE_NAMES`), followed by the square for `NO_MOVE`.
+             Triangles repeat their last point so all shapes have the same number of points.
+    """
+    return np.array([
+        ((size, 0.5), (1 - size, 1 - size), (1 - size, size), (1 - size, size)),  # Right
+        ((0.5, size), (size, 1 - size), (1 - size, 1 - size), (1 - size, 1 - size)),  # Down
+        ((1 - size, 0.5), (size, size), (size, 1 - size), (size, 1 - size)),  # Left
+        ((0.5, 1 - size), (1 - size, size), (size, size), (size, size)),  # Up
+        ((1 - size, 1 - size), (1 - size, size), (size, size), (size, 1 - size)),  # No move, a square
+    ]) * (cell_w, cell_h)
+
+
+def gui_draw_polygons(surface: pygame.Surface, color: GuiColor, shapes: Iterable[Sequence[GuiPoint]]) -> None:
+    """
+    Draw many filled polygons with the same color
+
+    :param surface: Surface to draw on.
+    :param color:   Color of all polygons.
+    :param shapes:  Points of every polygon.
+    """
+    # Neither pygame nor pygame-ce have a call which draws a list of polygons at once, so at least look up the draw
+    # function only once for the whole batch instead of once per polygon
+    draw_polygon = pygame.draw.polygon
+
+    # Lock the surface once for the whole batch, otherwise every draw call locks and unlocks it again
+    surface.lock()
+    try:
+        for shape in shapes:
+            draw_polygon(surface, color, shape)
+    finally:
+        surface.unlock()
+
+
+class GuiLayers(NamedTuple):
+    """
+    Layers of the drawn maze, kept while the same maze is shown
+    """
+    key: Tuple[int, Tuple[int, int]]  # id of the maze and canvas size for which the layers were created
+    background: pygame.Surface  # Pre-rendered maze (background color and all maze cells), which never changes
+    overlay: pygame.Surface  # Transparent surface with all paths drawn on top of the maze
+    cell_w: int  # Width of a maze cell
+    cell_h: int  # Height of a maze cell
+    border_lr: float  # Border on the left and right side of the maze
+    border_tb: float  # Border on the top and bottom side of the maze
+
+
+gui_layers: Optional[GuiLayers] = None
+
+# https://www.pygame.org/docs/ref/surface.html
+# https://www.pygame.org/docs/ref/draw.html
+GUI_PATH_COLOR = (50, 50, 200, 200)  # Last value is alpha (0 is fully transparent, 255 is fully opaque)
+GUI_FINAL_PATH_COLOR = (200, 0, 0, 240)
+
+
+def gui_cell_shapes(layers: GuiLayers, cells: np.ndarray, size: float) -> List[List[List[float]]]:
+    """
+    Calculate the arrows (see :func:`gui_arrow_shapes`) of many cells at once
+
+    :param layers: Drawn maze layers, defining the cell size and position.
+    :param cells:  Array of rows (x, y, move code).
+    :param size:   Size of the arrows relative to the cell.
+
+    :return: Points of the arrow of every cell.
+    """
+    # The shapes are already scaled to the cell size, move the shapes of all cells to their cell position at once
+    shapes = gui_arrow_shapes(size, layers.cell_w, layers.cell_h) + (layers.border_lr, layers.border_tb)
+    offsets = cells[:, :2] * (layers.cell_w, layers.cell_h)
+    return (shapes[cells[:, 2]] + offsets[:, None, :]).tolist()
 
 
 def gui_update(canvas: pygame.Surface, maze: Maze,
-               path: Tuple[int, int, str] = None,
+               path: Optional[List[Tuple[int, int, int]]] = None,
                final_path: Optional[Tuple[List[Point], List[str]]] = None) -> bool:
     """
     Draw the maze
 
     :param canvas:      Canvas to use for drawing.
     :param maze:        Maze data to draw.
-    :param path:        Path with moves to draw (e.g. while path searching), containing a tuple (x, y, move).
+    :param path:        Path with moves to draw (e.g. cells visited while path searching), containing tuples
+                        (x, y, move code), see :func:`gui_arrow_shapes`.
+                        Paths drawn by previous calls stay on the canvas until another maze is drawn.
     :param final_path:  Final path with moves to draw (different color than `path`).
-    :param path:        Maze data to draw.
 
     :return: Return value of :func:`gui_handle_events`.
     """
-    global maze_already_drawn
+    global gui_layers
 
-    # https://www.pygame.org/docs/ref/surface.html
-    # https://www.pygame.org/docs/ref/draw.html
-    background_color = (255, 255, 255, 255)  # Last value is alpha (0 is fully transparent, 255 is fully opaque)
-    path_color = (50, 50, 200, 200)
-    final_path_color = (200, 0, 0, 240)
+    background_color = (255, 255, 255, 255)
 
     # Get the current size of canvas and maze, used to calculate the size of the maze cells
     gui_w, gui_h = canvas.get_size()
-    maze_rows = len(maze)
-    maze_cols = len(maze[0])
-    cell_h = gui_h // maze_rows  # Height of the row is total canvas height divided by number of rows in the maze
-    cell_w = gui_w // maze_cols  # Width of the cell is total canvas width divided by number of cells in a row
+    background_key = (id(maze), (gui_w, gui_h))
+    if not gui_layers or gui_layers.key != background_key:
+        maze_rows = len(maze)
+        maze_cols = len(maze[0])
+        cell_h = gui_h // maze_rows  # Height of the row is total canvas height divided by number of rows in the maze
+        cell_w = gui_w // maze_cols  # Width of the cell is total canvas width divided by number of cells in a row
 
-    border_tb = (gui_h - maze_rows * cell_h) / 2  # Divided by 2 to add the same border on top and bottom
-    border_lr = (gui_w - maze_cols * cell_w) / 2  # Divided by 2 to add the same border on left and right
+        border_tb = (gui_h - maze_rows * cell_h) / 2  # Divided by 2 to add the same border on top and bottom
+        border_lr = (gui_w - maze_cols * cell_w) / 2  # Divided by 2 to add the same border on left and right
 
-    if not maze_already_drawn:
-        canvas.fill(background_color)
+        # Render the maze only once into a background surface, it is reused until another maze is drawn.
+        # It is converted to the pixel format of the canvas, so blitting it doesn't convert every pixel again.
+        background = pygame.Surface((gui_w, gui_h)).convert(canvas)
+        background.fill(background_color)
 
         color_map: Dict[str, GuiColor] = {
             START: (128, 0, 0),
@@ -123,65 +249,95 @@ def gui_update(canvas: pygame.Surface, maze: Maze,
             FREE: (200, 200, 200),
         }
 
-        # Draw maze cells
-        for y, row in enumerate(maze):
-            for x, cell in enumerate(row):
-                pygame.draw.rect(canvas, color_map[cell], (border_lr + x * cell_w,
-                                                           border_tb + y * cell_w, cell_w, cell_h))
-
-        maze_already_drawn = True
-
-    def get_shape(x_: int, y_: int, move_: str, size: float) -> Tuple[GuiPoint, ...]:
-        # Calculate 3 points of the triangle inside the square cell
-        pts = {
-            "Right": (
-                ((x_ + size) * cell_w, (y_ + 0.5) * cell_h),
-                ((x_ + 1 - size) * cell_w, (y_ + 1 - size) * cell_h),
-                ((x_ + 1 - size) * cell_w, (y_ + size) * cell_h)
-            ),
-            "Down": (
-                ((x_ + 0.5) * cell_w, (y_ + size) * cell_h),
-                ((x_ + size) * cell_w, (y_ + 1 - size) * cell_h),
-                ((x_ + 1 - size) * cell_w, (y_ + 1 - size) * cell_h)
-            ),
-            "Left": (
-                ((x_ + 1 - size) * cell_w, (y_ + 0.5) * cell_h),
-                ((x_ + size) * cell_w, (y_ + size) * cell_h),
-                ((x_ + size) * cell_w, (y_ + 1 - size) * cell_h)
-            ),
-            "Up": (
-                ((x_ + 0.5) * cell_w, (y_ + 1 - size) * cell_h),
-                ((x_ + 1 - size) * cell_w, (y_ + size) * cell_h),
-                ((x_ + size) * cell_w, (y_ + size) * cell_h)
-            ),
-        }.get(move_, (
-            # Otherwise, get a square
-            ((x_ + 1 - size) * cell_w, (y_ + 1 - size) * cell_h),
-            ((x_ + 1 - size) * cell_w, (y_ + size) * cell_h),
-            ((x_ + size) * cell_w, (y_ + size) * cell_h),
-            ((x_ + size) * cell_w, (y_ + 1 - size) * cell_h)
-        ))
-        # Add border offsets
-        # noinspection PyTypeChecker
-        return tuple((pt[0] + border_lr, pt[1] + border_tb) for pt in pts)
-
-    # Draw path, which is optional (list of points, list of moves)
+        # Look up the colors of all maze cells at once, indexed by the character codes of the cells.
+        # Unknown characters are drawn black, so are characters with codes beyond the table (index 0 is never set).
+        color_lut = np.zeros((256, 3), dtype=np.uint8)
+        for char, color in color_map.items():
+            color_lut[ord(char)] = color[:3]
+        char_codes = np.array(maze, dtype="U1").view(np.uint32)
+        cell_colors = color_lut[np.where(char_codes < len(color_lut), char_codes, 0)]
+
+        # Draw maze cells as single pixels of a small surface (one pixel per cell) and scale it up to the cell size,
+        # a single blit is much cheaper than drawing every cell with its own `pygame.draw.rect` call.
+        # Surface pixel arrays are indexed by [x, y], while the maze is indexed by [y, x].
+        cells = pygame.Surface((maze_cols, maze_rows))
+        pygame.surfarray.blit_array(cells, cell_colors.swapaxes(0, 1))
+        background.blit(pygame.transform.scale(cells, (maze_cols * cell_w, maze_rows * cell_h)),
+                        (border_lr, border_tb))
+
+        # A different maze is shown now, start with an empty overlay
+        gui_layers = GuiLayers(background_key, background, pygame.Surface((gui_w, gui_h), pygame.SRCALPHA),
+                               cell_w, cell_h, border_lr, border_tb)
+
+    # Draw path, which is optional (list of (x, y, move code))
     if path:
-        x, y, move = path
-        pygame.draw.polygon(canvas, path_color, get_shape(x, y, move, 0.9))
+        gui_draw_polygons(gui_layers.overlay, GUI_PATH_COLOR, gui_cell_shapes(gui_layers, np.array(path), 0.9))
 
     # Draw final path, which is optional (list of points, list of moves)
     if final_path:
-        for point, move in zip(*final_path):  # type: Point, str
-            pygame.draw.polygon(canvas, final_path_color, get_shape(point[0], point[1], move, 0.8))
+        points, moves = final_path
+        cells = np.array([(x, y, MOVE_NAMES.index(move)) for (x, y), move in zip(points, moves)],
+                         dtype=np.intp).reshape(-1, 3)
+        gui_draw_polygons(gui_layers.overlay, GUI_FINAL_PATH_COLOR, gui_cell_shapes(gui_layers, cells, 0.8))
 
-    # Update the display/canvas
-    pygame.display.update()
+    # Compose the layers on the canvas and update the display/canvas
+    canvas.blit(gui_layers.background, (0, 0))
+    canvas.blit(gui_layers.overlay, (0, 0))
+    pygame.display.flip()
 
     # Also handle GUI events after drawing to keep the window responsive
     return gui_handle_events()
 
 
+def gui_update_incremental(canvas: pygame.Surface, new_cells: np.ndarray) -> bool:
+    """
+    Draw only the newly visited cells (e.g. while path searching) on top of the maze drawn by :func:`gui_update`
+
+    Only the part of the canvas around the new cells is composed and updated on the display, so the work per call
+    doesn't grow with the number of cells drawn before.
+
+    :param canvas:    Canvas to use for drawing.
+    :param new_cells: Cells to draw, array of rows (x, y, move code), see :func:`gui_arrow_shapes`.
+
+    :return: Return value of :func:`gui_poll_quit_fast`.
+    """
+    layers = gui_layers
+    cell_w, cell_h = layers.cell_w, layers.cell_h
+    gui_draw_polygons(layers.overlay, GUI_PATH_COLOR, gui_cell_shapes(layers, new_cells, 0.9))
+
+    # Update a single rectangle bounding all new cells. Passing a list with a rectangle for every cell would be
+    # an anti-pattern: each rectangle is composed and presented separately, which for more than a few dozen
+    # rectangles is slower than updating the whole display at once.
+    # The rectangle is one pixel larger, because the borders are not whole pixels.
+    (x0, y0), (x1, y1) = new_cells[:, :2].min(axis=0).tolist(), new_cells[:, :2].max(axis=0).tolist()
+    dirty_rect = pygame.Rect(int(layers.border_lr) + x0 * cell_w, int(layers.border_tb) + y0 * cell_h,
+                             (x1 - x0 + 1) * cell_w + 1, (y1 - y0 + 1) * cell_h + 1)
+    canvas.blit(layers.background, dirty_rect, dirty_rect)
+    canvas.blit(layers.overlay, dirty_rect, dirty_rect)
+    pygame.display.update(dirty_rect)
+
+    # Also let SDL process the window events after drawing to keep the window responsive
+    return gui_poll_quit_fast()
+
+
+def clear_console() -> None:
+    """
+    Clear the console output
+
+    Writes the ANSI escape sequences moving the cursor to the top left corner and clearing the screen,
+    which is much faster than running a `cls`/`clear` process for every printed frame.
+    """
+    sys.stdout.write("\033[H\033[2J")
+    sys.stdout.flush()
+
+
+# Printed maze cells on the path, highlighted with a green background by ANSI escape sequences.
+# They are created only once instead of concatenating the escape sequences for every printed path cell.
+PATH_CELL_COLOR = "\033[0;102m"
+COLOR_RESET = "\033[0m"
+COLORED_PATH_CELLS = {cell: PATH_CELL_COLOR + cell + COLOR_RESET for cell in (START, END, FREE, WALL)}
+
+
 # Print the path using colors
 def print_path(maze: Maze, path=None, color: bool = True) -> None:
     """
@@ -190,146 +346,603 @@ def print_path(maze: Maze, path=None, color: bool = True) -> None:
     :param color: Should the path be printed in color text?
     """
 
-    # Copies the maze so that you don't change it
-    maze = copy.deepcopy(maze)
+    # Copies the maze so that you don't change it. The cells are immutable strings, so copying the rows is enough.
+    maze = [row[:] for row in maze]
 
     # If the path is provided, print the path inside the provided maze
     if path:
         # If color is True, print the path using colors, else use '@'
         if color:
+            colored_cells = COLORED_PATH_CELLS
             for x, y in path:  # If printing without colors add `[:-1]` after `path`
-                maze[y][x] = "\033[0;102m" + maze[y][x] + "\033[0m"  # instead of colors, you could use "@"
+                cell = maze[y][x]
+                # instead of colors, you could use "@"
+                maze[y][x] = colored_cells.get(cell) or PATH_CELL_COLOR + cell + COLOR_RESET
 
         else:
             # Print the shortest path inside the maze without using colors
             for x, y in path[:-1]:  # The last character is the end, so don't replace it
                 maze[y][x] = "@"
 
-    for line in maze:
-        print("".join(line))
+    # Join the whole maze into one string and write it at once instead of printing every row separately
+    sys.stdout.write("\n".join(["".join(line) for line in maze]) + "\n")
+
+
+def wall_adjacency(wall: np.ndarray) -> np.ndarray:
+    """
+    Precompute which neighbours of each cell can be moved to, so the path search doesn't have to check the maze
+    bounds and walls of every neighbour separately.
+
+    :param wall: Maze walls as a 2-D `numpy.uint8` array indexed by [y, x] (1 = wall, 0 = free).
+
+    :return: 2-D `numpy.uint8` array indexed by [y, x], bit `1 << move code` (see `MOVE_NAMES`) is set
+             if the neighbour in that direction is inside the maze and not a wall.
+    """
+    free = (wall == 0).astype(np.uint8)
+    adjacency = np.zeros(wall.shape, dtype=np.uint8)
+    adjacency[:, :-1] |= free[:, 1:]  # Right
+    adjacency[:-1, :] |= free[1:, :] << 1  # Down
+    adjacency[:, 1:] |= free[:, :-1] << 2  # Left
+    adjacency[1:, :] |= free[:-1, :] << 3  # Up
+    return adjacency
+
+
+@njit(cache=True)
+def bfs_kernel(adjacency: np.ndarray, sx: int, sy: int, ex: int, ey: int) -> Tuple[np.ndarray, bool]:
+    """
+    Breadth-first search over the maze grid, compiled with Numba (when available).
+
+    :param adjacency: Free neighbours of each cell, see :func:`wall_adjacency`.
+    :param sx:        Start point X.
+    :param sy:        Start point Y.
+    :param ex:        End point X.
+    :param ey:        End point Y.
+
+    :return: `move_from` array of the search tree (see :func:`bfs_with_progress`);
+             Was the end point reached?
+    """
+    h, w = adjacency.shape
+    visited = np.zeros((h, w), dtype=np.bool_)
+    move_from = np.zeros((h, w), dtype=np.uint8)
+
+    # Numba can't compile a `deque`, so the queue is a preallocated array of cell indices (y * w + x).
+    # Every cell is enqueued at most once, so it never holds more than h * w entries.
+    queue = np.empty(h * w, dtype=np.int32)
+    head = 0
+    tail = 0
+
+    visited[sy, sx] = True
+    queue[tail] = sy * w + sx
+    tail += 1
+
+    while head < tail:
+        idx = queue[head]
+        head += 1
+        y = idx // w
+        x = idx - y * w
+
+        if x == ex and y == ey:
+            return move_from, True
+
+        free = adjacency[y, x]
+        nx = x + 1  # Right
+        if free & 1 and not visited[y, nx]:
+            visited[y, nx] = True
+            move_from[y, nx] = 0
+            queue[tail] = idx + 1
+            tail += 1
+        ny = y + 1  # Down
+        if free & 2 and not visited[ny, x]:
+            visited[ny, x] = True
+            move_from[ny, x] = 1
+            queue[tail] = idx + w
+            tail += 1
+        nx = x - 1  # Left
+        if free & 4 and not visited[y, nx]:
+            visited[y, nx] = True
+            move_from[y, nx] = 2
+            queue[tail] = idx - 1
+            tail += 1
+        ny = y - 1  # Up
+        if free & 8 and not visited[ny, x]:
+            visited[ny, x] = True
+            move_from[ny, x] = 3
+            queue[tail] = idx - w
+            tail += 1
+
+    return move_from, False
+
+
+# Offsets (dx, dy) of the moves, indexed by the move codes (see `MOVE_NAMES`).
+# The opposite move of a move code `m` is `m ^ 2`.
+MOVE_DX = np.array((1, 0, -1, 0), dtype=np.int32)
+MOVE_DY = np.array((0, 1, 0, -1), dtype=np.int32)
+
+
+@njit(cache=True)
+def bfs_expand_layer(adjacency: np.ndarray, side: int, owner: np.ndarray, dist: np.ndarray, move_from: np.ndarray,
+                     queue: np.ndarray, head: int, tail: int) \
+        -> Tuple[int, int, int, int, int]:
+    """
+    Expand one whole layer of one side of a bidirectional breadth-first search.
+
+    All arrays except `adjacency` are flat and indexed by the cell index (y * w + x), every cell belongs to the search
+    tree of at most one side.
+
+    :param adjacency: Free neighbours of each cell, see :func:`wall_adjacency`.
+    :param side:      Side which is expanded (1 = search from the start point, 2 = search from the end point).
+    :param owner:     Side which reached each cell (0 = not reached yet).
+    :param dist:      Distance of each reached cell from the point its side started at.
+    :param move_from: Move code of the move used to reach each cell from the previous cell of its side.
+    :param queue:     Queue of cell indices of this side.
+    :param head:      Queue head, the current layer are the cells from `head` to `tail`.
+    :param tail:      Queue tail.
+
+    :return: Queue head and tail after the layer was expanded;
+             Index of the cell on this side and of the cell on the other side of the shortest connection between
+             the two searches found in this layer, and the move code from the former to the latter
+             (indices are -1 if the searches did not meet).
+    """
+    w = adjacency.shape[1]
+    meet_from = -1
+    meet_to = -1
+    meet_move = 0
+    meet_length = 0
+
+    layer_end = tail
+    while head < layer_end:
+        idx = queue[head]
+        head += 1
+        y = idx // w
+        x = idx - y * w
+
+        free = adjacency[y, x]
+        for move in range(4):
+            if not free & (1 << move):
+                continue
+
+            nidx = idx + MOVE_DY[move] * w + MOVE_DX[move]
+            if owner[nidx] == 0:
+                owner[nidx] = side
+                dist[nidx] = dist[idx] + 1
+                move_from[nidx] = move
+                queue[tail] = nidx
+                tail += 1
+            elif owner[nidx] != side:
+                # The searches met. Other connections found in the same layer can still be shorter by one.
+                length = dist[idx] + 1 + dist[nidx]
+                if meet_from < 0 or length < meet_length:
+                    meet_from = idx
+                    meet_to = nidx
+                    meet_move = move
+                    meet_length = length
+
+    return head, tail, meet_from, meet_to, meet_move
+
+
+@njit(cache=True)
+def bidirectional_bfs_kernel(adjacency: np.ndarray, sx: int, sy: int, ex: int, ey: int) \
+        -> Tuple[np.ndarray, bool]:
+    """
+    Bidirectional breadth-first search, searching from the start and the end point until the two searches meet.
+    Each search only has to reach about half the distance, so much fewer cells are visited than by :func:`bfs_kernel`.
+
+    :param adjacency: Free neighbours of each cell, see :func:`wall_adjacency`.
+    :param sx:        Start point X.
+    :param sy:        Start point Y.
+    :param ex:        End point X.
+    :param ey:        End point Y.
+
+    :return: `move_from` array of the search tree from the start point (see :func:`bfs_with_progress`);
+             Was the end point reached?
+    """
+    h, w = adjacency.shape
+    owner = np.zeros(h * w, dtype=np.uint8)
+    dist = np.zeros(h * w, dtype=np.int32)
+    move_from = np.zeros(h * w, dtype=np.uint8)
+
+    start_idx = sy * w + sx
+    end_idx = ey * w + ex
+    if start_idx == end_idx:
+        return move_from.reshape(h, w), True
+
+    queue_start = np.empty(h * w, dtype=np.int32)
+    queue_end = np.empty(h * w, dtype=np.int32)
+    owner[start_idx] = 1
+    owner[end_idx] = 2
+    queue_start[0] = start_idx
+    queue_end[0] = end_idx
+    head_start, tail_start = 0, 1
+    head_end, tail_end = 0, 1
+
+    # Stop as soon as either side can't reach any more cells, then there is no path between them
+    while head_start < tail_start and head_end < tail_end:
+        # Expand the side with the smaller layer, to keep the number of visited cells of both sides balanced
+        if tail_start - head_start <= tail_end - head_end:
+            head_start, tail_start, meet_from, meet_to, meet_move = bfs_expand_layer(
+                adjacency, 1, owner, dist, move_from, queue_start, head_start, tail_start)
+        else:
+            head_end, tail_end, meet_to, meet_from, meet_move = bfs_expand_layer(
+                adjacency, 2, owner, dist, move_from, queue_end, head_end, tail_end)
+            # The connection was found from the end side, flip the move to go from the start side to the end side
+            meet_move ^= 2
+
+        if meet_from >= 0:
+            # Reverse the moves of the cells of the end side between the meeting point and the end point, so they are
+            # reached from the start side and the whole path can be walked back from the end point like a single search
+            idx = meet_to
+            move = meet_move
+            while True:
+                # The cell was reached from the end side by the move `next_move`, from the cell one step closer to
+                # the end point
+                next_move = move_from[idx]
+                move_from[idx] = move
+                if idx == end_idx:
+                    break
+                idx -= MOVE_DY[next_move] * w + MOVE_DX[next_move]
+                move = next_move ^ 2
+            return move_from.reshape(h, w), True
+
+    return move_from.reshape(h, w), False
+
+
+@njit(cache=True)
+def astar_kernel(adjacency: np.ndarray, sx: int, sy: int, ex: int, ey: int) -> Tuple[np.ndarray, bool]:
+    """
+    A* search with the Manhattan distance to the end point as the heuristic. Cells closer to the end point are
+    visited first, so unlike a breadth-first search it doesn't visit all cells up to the distance of the end point.
+    The heuristic never overestimates the remaining distance, so the found path is still a shortest one.
+
+    :param adjacency: Free neighbours of each cell, see :func:`wall_adjacency`.
+    :param sx:        Start point X.
+    :param sy:        Start point Y.
+    :param ex:        End point X.
+    :param ey:        End point Y.
+
+    :return: `move_from` array of the search tree (see :func:`bfs_with_progress`);
+             Was the end point reached?
+    """
+    h, w = adjacency.shape
+    move_from = np.zeros((h, w), dtype=np.uint8)
+
+    # Shortest known distance of each cell from the start point
+    g_score = np.full((h, w), np.iinfo(np.int32).max, dtype=np.int32)
+    g_score[sy, sx] = 0
+
+    # Priority queue of (estimated path length through the cell, counter, distance from the start point, x, y).
+    # The counter grows with every pushed cell, so cells with the same estimate are visited in FIFO order.
+    counter = 0
+    heap = [(abs(ex - sx) + abs(ey - sy), counter, 0, sx, sy)]
+
+    while heap:
+        _, _, g, x, y = heapq.heappop(heap)
+        if g > g_score[y, x]:
+            # The cell was pushed again with a shorter distance and already visited, this entry is stale
+            continue
+
+        if x == ex and y == ey:
+            return move_from, True
+
+        g += 1
+        free = adjacency[y, x]
+        for move in range(4):
+            nx = x + MOVE_DX[move]
+            ny = y + MOVE_DY[move]
+            if not free & (1 << move) or g >= g_score[ny, nx]:
+                continue
+
+            g_score[ny, nx] = g
+            move_from[ny, nx] = move
+            counter += 1
+            heapq.heappush(heap, (g + abs(ex - nx) + abs(ey - ny), counter, g, nx, ny))
+
+    return move_from, False
+
+
+def wavefront_search(adjacency: np.ndarray, sx: int, sy: int, ex: int, ey: int) \
+        -> Tuple[np.ndarray, bool]:
+    """
+    Breadth-first search expanding the whole frontier (all cells at the same distance) at once with NumPy array
+    operations. Each BFS layer costs a few array operations in C instead of Python code for every cell, so it is
+    fast without Numba, especially for open mazes with wide frontiers.
+
+    :param adjacency: Free neighbours of each cell, see :func:`wall_adjacency`.
+    :param sx:        Start point X.
+    :param sy:        Start point Y.
+    :param ex:        End point X.
+    :param ey:        End point Y.
+
+    :return: `move_from` array of the search tree (see :func:`bfs_with_progress`);
+             Was the end point reached?
+    """
+    h, w = adjacency.shape
+    move_from = np.zeros(h * w, dtype=np.uint8)
+    unvisited = np.ones(h * w, dtype=bool)
+    free_moves = adjacency.ravel()
+    end_idx = ey * w + ex
+
+    # Difference of the cell index (y * w + x) of the neighbour in the direction of each move
+    index_steps = MOVE_DY * w + MOVE_DX
+
+    # The frontier is kept as an array of cell indices instead of a mask of the whole grid,
+    # so expanding a layer doesn't cost more than the number of cells in it
+    frontier = np.array([sy * w + sx], dtype=np.int32)
+    unvisited[frontier] = False
+
+    while unvisited[end_idx] and frontier.size:
+        reached = []
+        for move in range(len(MOVE_NAMES)):
+            # The adjacency bits are only set for neighbours inside the maze, so the indices never wrap around rows
+            source = frontier[(free_moves[frontier] & (1 << move)) != 0]
+            target = source + index_steps[move]
+            # Cells reached by an earlier move of this layer are already marked visited, so each cell is reached
+            # by only one move. Different sources reach different targets in the same direction.
+            target = target[unvisited[target]]
+            unvisited[target] = False
+            move_from[target] = move
+            reached.append(target)
+        frontier = np.concatenate(reached)
+
+    return move_from.reshape(h, w), not unvisited[end_idx]
+
+
+# Path search kernels which can be selected in :func:`find_shortest_path`, they all return the search tree
+# from the start point as a `move_from` array and whether the end point was reached
+SEARCH_KERNELS = {
+    "bfs": bfs_kernel,
+    "bidirectional": bidirectional_bfs_kernel,
+    "astar": astar_kernel,
+    "wavefront": wavefront_search,
+}
+
+# Without Numba the kernels run as plain Python code per cell, then the NumPy wavefront search is the fastest one
+DEFAULT_ALGORITHM = "astar" if NUMBA_AVAILABLE else "wavefront"
+
+
+# Minimum time between two shown frames of the search progress (in seconds), the same frame rate as the GUI
+PROGRESS_FRAME_TIME = 1 / GUI_FPS
+
+
+def progress_cells(indices: np.ndarray, row_width: int, move_from: bytearray, start_idx: int) -> np.ndarray:
+    """
+    Convert cells visited by :func:`bfs_with_progress` to the cells drawn by :func:`gui_update_incremental`
+
+    :param indices:   Cell indices of the visited cells in the grid with a border (see :func:`bfs_with_progress`).
+    :param row_width: Width of the grid with a border (maze width + 2).
+    :param move_from: Move codes of the moves used to reach each cell.
+    :param start_idx: Cell index of the start point.
+
+    :return: Array of rows (x, y, move code) in maze coordinates, see :func:`gui_arrow_shapes`.
+    """
+    moves = np.frombuffer(move_from, dtype=np.uint8)[indices].astype(np.intc)
+    # The start cell was not reached by any move
+    moves[indices == start_idx] = NO_MOVE
+    y, x = np.divmod(indices, row_width)
+    return np.stack((x - 1, y - 1, moves), axis=1)
+
+
+def bfs_with_progress(mat: Maze, wall: np.ndarray, start_point: Point, end_point: Point,
+                      canvas: Optional[pygame.Surface] = None) -> Optional[Tuple[np.ndarray, bool]]:
+    """
+    Breadth-first search which also shows its progress. The cells visited so far are printed or drawn after a
+    finished BFS layer at most once per `PROGRESS_FRAME_TIME`, and once more when the search is done.
+
+    :param mat:         Maze data.
+    :param wall:        Maze walls as a 2-D `numpy.uint8` array indexed by [y, x] (1 = wall, 0 = free).
+    :param start_point: Source/start point.
+    :param end_point:   Destination/end point.
+    :param canvas:      Graphic canvas to which to draw the search progress to it instead to a stdout.
+
+    :return: `move_from` array holding the direction code (index into `MOVE_NAMES`) of the move used to reach each
+             cell, the previous cell is one step in the opposite direction;
+             Was the end point reached?
+             None if the search was stopped, because the GUI window was closed.
+    """
+    sx, sy = start_point
+    ex, ey = end_point
+
+    # The search runs on the maze surrounded by a border of one cell, so the neighbours of every maze cell are
+    # inside the grid. Cell indices are `(y + 1) * row_width + (x + 1)`.
+    h, w = wall.shape
+    row_width = w + 2
+    start_idx = (sy + 1) * row_width + sx + 1
+    end_idx = (ey + 1) * row_width + ex + 1
+
+    # Indexing NumPy arrays from interpreted Python code is slow, because every read boxes a NumPy scalar.
+    # So this search keeps its grids in flat bytearray/array objects indexed by the cell index,
+    # each index is a single C-level lookup returning a plain `int`.
+
+    # Cells which can't be moved to: the walls and the border are marked in the same flat array as the visited cells,
+    # so checking a neighbour is a single byte test instead of separate bounds, wall and visited checks
+    blocked = np.ones((h + 2, row_width), dtype=np.uint8)
+    blocked[1:-1, 1:-1] = wall != 0
+    blocked = bytearray(blocked.tobytes())
+
+    # Instead of chaining every cell to the tuple of its previous cell, keep the search tree in a flat array of
+    # the moves used to reach each cell, one byte per cell
+    move_from = bytearray((h + 2) * row_width)
+
+    # Preallocated FIFO queue of cell indices with head/tail cursors instead of a deque of tuples. The indices are
+    # in the grid with the border, `(y + 1) * row_width + x + 1`, the same as in `blocked` and `move_from`.
+    # Border cells are blocked and every maze cell is enqueued at most once, so it never holds more than w * h
+    # entries. Plain Python reads and writes single items of an `array.array` without boxing them into NumPy
+    # scalars like a `numpy` array would.
+    queue = array.array("i", [0]) * (w * h)
+    head = 0
+    tail = 0
+
+    # mark the source cell as visited and enqueue the source node
+    blocked[start_idx] = 1
+    queue[tail] = start_idx
+    tail += 1
+
+    # The cells of the current BFS layer (all at the same distance from the source) end at `layer_end`,
+    # the queue tail when the layer started
+    layer_end = tail
+
+    found = False
+
+    # Drawing or printing a frame for every cell or BFS layer would make it the bottleneck of the search, so a new
+    # frame is shown after a finished BFS layer at most once per `PROGRESS_FRAME_TIME`, however many cells were
+    # visited in the meantime. The cells dequeued since the last shown frame are the part of the queue from
+    # `drawn_head` to `head`, so the loop doesn't have to do any drawing work for each cell.
+    drawn_head = 0
+    last_frame_time = 0.0
+
+    # Bind the global names used for every BFS layer to locals, which are faster to look up
+    perf_counter = time.perf_counter
+    frame_time = PROGRESS_FRAME_TIME
+
+    # Draw the maze once, afterwards only the newly visited cells are drawn on top of it
+    if canvas and not gui_update(canvas, mat):
+        return None
+
+    # loop till queue is empty
+    while head < tail:
+        if head == layer_end:
+            layer_end = tail
+
+            now = perf_counter()
+            if now - last_frame_time >= frame_time:
+                # All cells dequeued so far are at the front of the queue, so they don't have to be collected
+                # into a separate set of points
+                dequeued = np.frombuffer(queue, dtype=np.intc, count=head)
+                if canvas:
+                    if not gui_update_incremental(canvas, progress_cells(dequeued[drawn_head:], row_width, move_from,
+                                                                         start_idx)):
+                        # The window was closed, there is nothing to show the search progress on anymore
+                        return None
+                else:
+                    y, x = np.divmod(dequeued, row_width)
+                    clear_console()
+                    print_path(mat, list(zip((x - 1).tolist(), (y - 1).tolist())), color=True)
+                drawn_head = head
+                last_frame_time = now
+
+        # dequeue front node and process it
+        idx = queue[head]
+        head += 1
+
+        # if the destination is found, stop
+        if idx == end_idx:
+            found = True
+            break
+
+        # check for all four possible movements from the current cell and enqueue each valid movement.
+        # The moves are unrolled instead of iterating over a dict of (dx, dy) offsets, thanks to the border
+        # the neighbours never wrap to other rows or fall outside the grid.
+        next_idx = idx + 1  # Right
+        if not blocked[next_idx]:
+            # mark next cell as visited, remember where it was reached from and enqueue it
+            blocked[next_idx] = 1
+            move_from[next_idx] = 0
+            queue[tail] = next_idx
+            tail += 1
+        next_idx = idx + row_width  # Down
+        if not blocked[next_idx]:
+            blocked[next_idx] = 1
+            move_from[next_idx] = 1
+            queue[tail] = next_idx
+            tail += 1
+        next_idx = idx - 1  # Left
+        if not blocked[next_idx]:
+            blocked[next_idx] = 1
+            move_from[next_idx] = 2
+            queue[tail] = next_idx
+            tail += 1
+        next_idx = idx - row_width  # Up
+        if not blocked[next_idx]:
+            blocked[next_idx] = 1
+            move_from[next_idx] = 3
+            queue[tail] = next_idx
+            tail += 1
+
+    # Show the cells visited since the last frame, so the last frame holds all visited cells
+    if drawn_head < head:
+        dequeued = np.frombuffer(queue, dtype=np.intc, count=head)
+        if canvas:
+            if not gui_update_incremental(canvas, progress_cells(dequeued[drawn_head:], row_width, move_from,
+                                                                 start_idx)):
+                return None
+        else:
+            y, x = np.divmod(dequeued, row_width)
+            clear_console()
+            print_path(mat, list(zip((x - 1).tolist(), (y - 1).tolist())), color=True)
+
+    # Return the moves of the maze cells without the border
+    return np.frombuffer(move_from, dtype=np.uint8).reshape(h + 2, row_width)[1:-1, 1:-1], found
 
 
 # Find the shortest possible route in a matrix `mat` from source `src` to
 # destination `dest`
-def find_shortest_path(mat: Maze, start_point: Point, end_point: Point,
-                       print_progress: bool = False, canvas: Optional[pygame.Surface] = None) \
+def find_shortest_path(mat: Maze, wall: np.ndarray, start_point: Point, end_point: Point,
+                       print_progress: bool = False, canvas: Optional[pygame.Surface] = None,
+                       algorithm: str = DEFAULT_ALGORITHM) \
         -> Tuple[Optional[List[Point]], Optional[List[str]]]:
     """
     https://www.techiedelight.com/lee-algorithm-shortest-path-in-a-maze
 
     :param mat:            Maze data.
+    :param wall:           Maze walls as a 2-D `numpy.uint8` array indexed by [y, x] (1 = wall, 0 = free).
     :param start_point:    Source/start point.
     :param end_point:      Destination/end point.
     :param print_progress: Should the printing process be printed?
     :param canvas:         Graphic canvas to which to draw the maze to it instead to a stdout.
+    :param algorithm:      Search to use when the progress is not printed, key of `SEARCH_KERNELS`.
+                           The progress is always shown for a plain breadth-first search.
 
     :return: List of points which the algorithm reached when executing moves (including the destination cell);
              List of moves needed to reach each cell.
+             Both are None if the path doesn't exist or the search was stopped by closing the GUI window.
     """
     sx, sy = start_point
     ex, ey = end_point
 
     # base case: invalid input
-    if not mat or len(mat) == 0 or mat[sy][sx] == 0 or mat[ey][ex] == 0:
+    if wall.size == 0 or wall[sy, sx] or wall[ey, ex]:
         return None, None
 
-    # construct a matrix to keep track of visited cells
-    visited = [[False for _ in row] for row in mat]
-
-    # Function to check if it is possible to go to position (r, c)
-    # from the current position. The function returns false if r, c
-    # is not a valid position or has a value 0 or already visited.
-    def is_valid(px: int, py: int) -> bool:
-        """
-        :param px: Point X.
-        :param py: Point Y.
-        :return: Is the cell ok to move to?
-        """
-        return ((py >= 0) and (py < len(mat)) and (px >= 0) and (px < len(mat[py]))
-                and mat[py][px] != WALL and not visited[py][px])
-
-    # Below lists detail all four possible x,y movements from a cell, so we can just iterate
-    # over these combinations instead of repeating "the same" check 4 times for every direction.
-    # Diagonal movements could also be added here, in that case there would be 8 possible possible_moves.
-    possible_moves: Dict[str, Point] = {
-        "Right": (1, 0),  # x + 1
-        "Down": (0, 1),  # y + 1
-        "Left": (-1, 0),  # x - 1
-        "Up": (0, -1),  # y - 1
-    }
-
-    # create an empty queue
-    q: Deque[Tuple[int, int, int, Optional[str], Optional[tuple]]] = deque()
-
-    # mark the source cell as visited and enqueue the source node
-    visited[sy][sx] = True
-
-    # (sx, sy, dist, move, prev_cell) represents matrix cell coordinates, their minimum distance from the source,
-    # the move used to reach this cell, and the previous cell from which you came
-    cell = (sx, sy, 0, None, None)
-    q.append(cell)
-
-    # stores length of the longest path from source to destination
-    min_dist = sys.maxsize
-
-    # Used only when `print_progress` is true
-    last_printed_distance = None
-    all_paths = set()
-
-    # loop till queue is empty
-    while q:
-
-        # dequeue front node and process it
-        cell = q.popleft()
-        (x, y, dist, move, _) = cell
-        # (x, y) represents a current cell, and `dist` stores its
-        # minimum distance from the source
-
-        if print_progress:
-            if canvas:
-                gui_update(canvas, mat, path=(x, y, move))
-            else:
-                all_paths.add((x, y))
-                if last_printed_distance != dist:
-                    # Clear the output
-                    os.system("cls" if os.name == 'nt' else "clear")
-                    print_path(mat, all_paths, color=True)
-                    last_printed_distance = dist
-
-        # if the destination is found, update `min_dist` and stop
-        if x == ex and y == ey:
-            min_dist = dist
-            break
-
-        # check for all four possible movements from the current cell
-        # and enqueue each valid movement
-        for move, (dx, dy) in possible_moves.items():
-            # check if it is possible to go to position
-            if is_valid(x + dx, y + dy):
-                # mark next cell as visited and enqueue it
-                visited[y + dy][x + dx] = True
-                q.append((x + dx, y + dy, dist + 1, move, cell))
+    if print_progress:
+        result = bfs_with_progress(mat, wall, start_point, end_point, canvas)
+        if result is None:
+            # The GUI window was closed while searching
+            return None, None
+        move_from, found = result
+    else:
+        # Nothing has to be shown while searching, so the whole search runs in one kernel
+        move_from, found = SEARCH_KERNELS[algorithm](wall_adjacency(wall), sx, sy, ex, ey)
 
     # If the path was not found, report an error
-    if min_dist == sys.maxsize:
+    if not found:
         return None, None
 
+    # Walk the moves back from the destination to the source, the previous cell is one step against the move.
+    # Flatten the array once, so each step is a plain index instead of creating a new `.flat` iterator.
+    w = wall.shape[1]
+    move_from = move_from.ravel()
+    index_steps = (MOVE_DY * w + MOVE_DX).tolist()
     path: List[Point] = []
     moves: List[str] = []
-    while True:
-        (x, y, _, move, prev_cell) = cell
-        # If the previous cell in None, then the current cell is the start cell
-        if not prev_cell:
-            return path, moves
+    idx = ey * w + ex
+    start_idx = sy * w + sx
+    while idx != start_idx:
+        move = move_from[idx]
+        path.append((idx % w, idx // w))
+        moves.append(MOVE_NAMES[move])
+        idx -= index_steps[move]
 
-        # Add the move to that cell at the beginning of the list
-        moves.insert(0, move)
-        # Add the cell at the beginning of the list
-        path.insert(0, (x, y))
-        cell = prev_cell
+    # The cells were collected from the destination backwards, appending and reversing once is linear
+    # while inserting each cell at the beginning of the lists would be quadratic
+    path.reverse()
+    moves.reverse()
+    return path, moves
 
 
 def main() -> int:
+    if os.name == "nt":
+        # Running any command makes the Windows console process ANSI escape sequences, see :func:`clear_console`
+        os.system("")
+
     # List all files that don't have any extension
     files = [f for f in os.listdir() if os.path.isfile(f) and not os.path.splitext(f)[1]]
     print("Enter file number to read maze data")
@@ -344,22 +957,28 @@ def main() -> int:
         content = file.read().strip()  # Remove spaces and newlines from both ends of file
 
     # Maze content is separated by spaces
-    maze: Maze = [[c for c in row] for row in content.split(" ")]
+    maze: Maze = [list(row) for row in content.split(" ")]
+    if any(len(row) != len(maze[0]) for row in maze):
+        print("All rows of the maze must have the same length")
+        return -1
+
+    # Characters of all maze cells as a single grid indexed by [y, x], so the cells are searched and compared
+    # with vectorized NumPy operations instead of per character Python code
+    cells = np.array(maze, dtype="U1")
+    # Walls as a compact `uint8` grid, which is what the path searching operates on
+    wall = (cells == WALL).astype(np.uint8)
 
     canvas = gui_init_window()
 
     print(f"Dimensions of the entered maze are: {len(maze)}*{len(maze[0])}")
     print_path(maze)
 
-    start_point = None
-    end_point = None
-    # Print entire maze and find the start and end point
-    for y, line in enumerate(maze):
-        for x, cell in enumerate(line):
-            if cell == START:
-                start_point = (x, y)
-            elif cell == END:
-                end_point = (x, y)
+    # Find the start and end point, `numpy.argwhere` returns the [y, x] indices of the matching cells in row order.
+    # If a point is in the maze more than once, the last one is used.
+    start_cells = np.argwhere(cells == START)
+    end_cells = np.argwhere(cells == END)
+    start_point = (int(start_cells[-1, 1]), int(start_cells[-1, 0])) if len(start_cells) else None
+    end_point = (int(end_cells[-1, 1]), int(end_cells[-1, 0])) if len(end_cells) else None
 
     if not start_point:
         print("Start point could not be found")
@@ -373,16 +992,22 @@ def main() -> int:
     print_progress = True  # (input("Print searching process? [Y/n]: ").lower().strip() == "y")
 
     print('Open the "Python Pathfinding" window and left-click')
-    gui_update(canvas, maze)
-
     # Process GUI events so that the GUI window can be brought to front and clicked
-    gui_handle_events(wait_left_click=True)
+    if not gui_update(canvas, maze) or not gui_handle_events(wait_left_click=True):
+        print("The window was closed")
+        return 0
 
     t0 = time.perf_counter()
-    path, moves = find_shortest_path(maze, start_point, end_point, print_progress, canvas=canvas)
+    path, moves = find_shortest_path(maze, wall, start_point, end_point, print_progress, canvas=canvas)
     dt = time.perf_counter() - t0
 
+    # Handle the events left pending by the search, the window could have been closed while searching
+    window_open = gui_handle_events()
+
     if not path:
+        if not window_open:
+            print(f"The window was closed, searching was stopped after {dt:.1f} s")
+            return 0
         print(f"Shortest path could not be found in {dt:.1f} s")
         return -1
     print(f"Shortest path length is: {len(path)} in {dt:.1f} s")
@@ -393,11 +1018,14 @@ def main() -> int:
 
     # Print the final path. 3rd argument is color printing [True/False], default: True
     print_path(maze, path, color=True)
-    gui_update(canvas, maze, final_path=(path, moves))
+    if not window_open or not gui_update(canvas, maze, final_path=(path, moves)):
+        return 0
 
+    # Keep the window open until it is closed. The final frame doesn't change anymore, so every frame only handles
+    # the events, and the clock waits for the next frame to prevent busy-looping and consuming high CPU for no reason.
+    clock = pygame.time.Clock()
     while gui_handle_events():
-        # Sleep a while to prevent busy-looping and consuming high CPU for no reason
-        time.sleep(0.01)
+        clock.tick(GUI_FPS)
 
     return 0
 